@@ -5,6 +5,9 @@ from __future__ import annotations
 import math
 import random
 import time
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
 
 
 class WeatherSimulator:
@@ -52,6 +55,21 @@ class WeatherSimulator:
             "rain_probability": round(rain_prob, 3),
         }
 
+    def tick_batch(self, ts: Iterable[float]) -> dict[str, list[float]]:
+        """Tick once per t, in order, and return each field as a column.
+
+        Values and RNG consumption match calling tick(t) for each t.
+        """
+        columns: dict[str, list[float]] = {
+            "temperature": [], "wind_speed": [], "humidity": [],
+            "pressure": [], "rain_probability": [],
+        }
+        tick = self.tick
+        for t in ts:
+            for key, value in tick(t).items():
+                columns[key].append(value)
+        return columns
+
 
 class CardiacSimulator:
     """Simulates cardiac R-R intervals with configurable heart rate and variability."""
@@ -136,8 +154,8 @@ class LorenzAttractor:
         self.x = 1.0
         self.y = 1.0
         self.z = 1.0
-        self._trail: list[tuple[float, float, float]] = []
         self._max_trail = 500
+        self._trail: deque[tuple[float, float, float]] = deque(maxlen=self._max_trail)
 
     def step(self) -> tuple[float, float, float]:
         dx = self.sigma * (self.y - self.x)
@@ -147,16 +165,34 @@ class LorenzAttractor:
         self.y += dy * self.dt
         self.z += dz * self.dt
         self._trail.append((self.x, self.y, self.z))
-        if len(self._trail) > self._max_trail:
-            self._trail.pop(0)
         return self.x, self.y, self.z
 
+    def step_n(self, n: int) -> tuple[float, float, float]:
+        """Advance n steps; same result as calling step() n times."""
+        x, y, z = self.x, self.y, self.z
+        sigma, rho, beta, dt = self.sigma, self.rho, self.beta, self.dt
+        append = self._trail.append
+        for _ in range(n):
+            dx = sigma * (y - x)
+            dy = x * (rho - z) - y
+            dz = x * y - beta * z
+            x += dx * dt
+            y += dy * dt
+            z += dz * dt
+            append((x, y, z))
+        self.x, self.y, self.z = x, y, z
+        return x, y, z
+
+    def recent(self, n: int) -> list[tuple[float, float, float]]:
+        """The last n trail points, oldest first."""
+        return list(islice(self._trail, max(0, len(self._trail) - n), None))
+
     @property
     def chaos_metric(self) -> float:
         """0..1 estimate of how chaotic the current trajectory is."""
         if len(self._trail) < 10:
             return 0.5
-        recent = self._trail[-10:]
+        recent = self.recent(10)
         diffs = [
             math.sqrt((b[0]-a[0])**2 + (b[1]-a[1])**2 + (b[2]-a[2])**2)
             for a, b in zip(recent, recent[1:])
@@ -170,6 +206,10 @@ class MathSimulator:
     """Generates data from mathematical systems: Lorenz, logistic map, sine superposition."""
 
     def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Return every mode to its freshly constructed state."""
         self._lorenz = LorenzAttractor()
         self._logistic_x = 0.5
         self._rng = random.Random(77)
@@ -183,14 +223,13 @@ class MathSimulator:
             # chaos_param controls rho (20-30 range: periodic to chaotic)
             self._lorenz.rho = 20 + chaos_param * 10
             # Step multiple times per tick for smooth animation
-            for _ in range(10):
-                x, y, z = self._lorenz.step()
+            x, y, z = self._lorenz.step_n(10)
 
             amplitude = math.sqrt(x * x + y * y + z * z) / 50.0  # normalize ~0-1
             # Estimate "chaos" via variance of recent trajectory
-            trail = self._lorenz._trail
-            if len(trail) > 20:
-                recent_x = [p[0] for p in trail[-20:]]
+            lorenz = self._lorenz
+            if len(lorenz._trail) > 20:
+                recent_x = [p[0] for p in lorenz.recent(20)]
                 variance = sum((v - sum(recent_x) / len(recent_x)) ** 2 for v in recent_x) / len(recent_x)
                 chaos_level = min(1.0, variance / 200.0)
             else:
@@ -203,7 +242,7 @@ class MathSimulator:
                 "z": round(z, 3),
                 "amplitude": round(min(1.0, amplitude), 3),
                 "chaos_level": round(chaos_level, 3),
-                "trail": [(round(p[0], 1), round(p[1], 1)) for p in trail[-200:]],
+                "trail": [(round(p[0], 1), round(p[1], 1)) for p in lorenz.recent(200)],
             }
 
         elif mode == "logistic":
@@ -341,3 +380,8 @@ class NetworkSimulator:
             k += 1
             p *= self._rng.random()
         return k - 1
+
+    def _poisson_batch(self, lam: float, size: int) -> list[int]:
+        """size Poisson variates; same draws as calling _poisson(lam) size times."""
+        poisson = self._poisson
+        return [poisson(lam) for _ in range(size)]
@@ -6,11 +6,99 @@ import asyncio
 import os
 import struct
 import time
-from functools import partial
+from bisect import bisect_right
+from functools import cache, partial
+from operator import itemgetter
 
 from lenses.base import ControlState
 from lyria_bridge import MockAudioGenerator
 
+# Prompt descriptor fragments, defined once so _build_prompt reuses the same
+# string objects on every call instead of materialising new ones.
+_SLOW_TEMPO = "slow tempo"
+_MODERATE_TEMPO = "moderate tempo"
+_UPBEAT_TEMPO = "upbeat tempo"
+_FAST_TEMPO = "fast energetic tempo"
+_SPARSE = "sparse minimal arrangement"
+_DENSE = "dense layered arrangement"
+_DARK = "dark muted tones"
+_BRIGHT = "bright shimmering tones"
+_NO_BASS = "no bass"
+_NO_DRUMS = "no drums"
+_EXPERIMENTAL = "experimental, unconventional"
+_STRUCTURED = "structured, predictable"
+_INSTRUMENTAL = "instrumental"
+
+# BPM boundaries between slow / moderate / upbeat / fast tempo descriptors
+_TEMPO_EDGES = (80, 110, 140)
+_TEMPO_DESCRIPTORS = (_SLOW_TEMPO, _MODERATE_TEMPO, _UPBEAT_TEMPO, _FAST_TEMPO)
+
+# Scale -> key / mood descriptor
+_SCALE_MOODS: dict[str, str] = {
+    "C_MAJOR_A_MINOR": "C major, uplifting mood",
+    "D_MAJOR_B_MINOR": "D major, bright joyful mood",
+    "A_FLAT_MAJOR_F_MINOR": "F minor, melancholic mood",
+    "G_FLAT_MAJOR_E_FLAT_MINOR": "E-flat minor, dark brooding mood",
+}
+
+
+def _band(value: float, low: float, high: float) -> int:
+    """Return -1 below low, 1 above high, 0 in between (both edges inclusive)."""
+    if value < low:
+        return -1
+    if value > high:
+        return 1
+    return 0
+
+
+@cache
+def _descriptor_suffix(
+    tempo: int,
+    density: int,
+    brightness: int,
+    mood: str | None,
+    mute_bass: bool,
+    mute_drums: bool,
+    temperature: int,
+) -> str:
+    """Build the descriptor tail of a prompt for one bucket combination.
+
+    Arguments come from ElevenLabsBridge._descriptor_buckets(). There are
+    only a few hundred combinations, so each tail is built once and cached.
+    """
+    parts = [_TEMPO_DESCRIPTORS[tempo]]
+
+    # Density -> arrangement
+    if density < 0:
+        parts.append(_SPARSE)
+    elif density > 0:
+        parts.append(_DENSE)
+
+    # Brightness -> tone
+    if brightness < 0:
+        parts.append(_DARK)
+    elif brightness > 0:
+        parts.append(_BRIGHT)
+
+    # Scale -> key / mood
+    if mood:
+        parts.append(mood)
+
+    # Mute flags
+    if mute_bass:
+        parts.append(_NO_BASS)
+    if mute_drums:
+        parts.append(_NO_DRUMS)
+
+    # Temperature -> experimental vs structured
+    if temperature > 0:
+        parts.append(_EXPERIMENTAL)
+    elif temperature < 0:
+        parts.append(_STRUCTURED)
+
+    parts.append(_INSTRUMENTAL)
+    return ", ".join(parts)
+
 
 class ElevenLabsBridge:
     """Generates music via ElevenLabs Music API, same interface as LyriaBridge.
@@ -46,6 +134,7 @@ class ElevenLabsBridge:
         self._committed_prompt: str = ""  # The prompt currently generating/playing
         self._last_prompt_change: float = 0.0
         self._pending_prompt: str = ""  # Waiting for debounce to commit
+        self._last_fingerprint: tuple | None = None  # Prompt-relevant state of last update
         self._stop_event = asyncio.Event()
         self._generation_task: asyncio.Task | None = None
         self._segment_length_ms = 30_000
@@ -88,7 +177,15 @@ class ElevenLabsBridge:
             self._mock.update_from_controls(controls)
             return
 
-        new_prompt = self._build_prompt(controls)
+        # Most ticks only move values within a descriptor bucket; skip the
+        # rebuild when nothing that feeds the prompt text has changed.
+        fingerprint = self._prompt_fingerprint(controls)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        buckets, pairs = fingerprint
+        new_prompt = self._build_prompt_from(pairs, buckets)
         if new_prompt != self._current_prompt:
             self._current_prompt = new_prompt
             self._pending_prompt = new_prompt
@@ -107,6 +204,7 @@ class ElevenLabsBridge:
         self._current_prompt = ""
         self._committed_prompt = ""
         self._pending_prompt = ""
+        self._last_fingerprint = None
         self._gen_id += 1  # Invalidate any in-flight generation
         # Drain the queue
         while not self._audio_queue.empty():
@@ -128,64 +226,46 @@ class ElevenLabsBridge:
 
     # ── prompt builder ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _descriptor_buckets(controls: ControlState) -> tuple:
+        """Reduce the non-prompt fields to the descriptor bucket they fall in.
+
+        Returns (tempo, density, brightness, mood, mute_bass, mute_drums,
+        temperature) as accepted by _descriptor_suffix().
+        """
+        return (
+            bisect_right(_TEMPO_EDGES, controls.bpm),
+            _band(controls.density, 0.3, 0.7),
+            _band(controls.brightness, 0.3, 0.7),
+            _SCALE_MOODS.get(controls.scale),
+            bool(controls.mute_bass),
+            bool(controls.mute_drums),
+            _band(controls.temperature, 0.5, 2.0),
+        )
+
+    @staticmethod
+    def _prompt_fingerprint(controls: ControlState) -> tuple:
+        """Coarse key of the ControlState fields that feed _build_prompt().
+
+        Two states with equal fingerprints always build the same prompt.
+        Returns (descriptor_buckets, prompt_pairs), the two inputs of
+        _build_prompt_from(), so update() computes each only once.
+        """
+        return ElevenLabsBridge._descriptor_buckets(controls), controls.prompt_pairs()
+
     @staticmethod
     def _build_prompt(controls: ControlState) -> str:
-        parts: list[str] = []
+        return ElevenLabsBridge._build_prompt_from(
+            controls.prompt_pairs(), ElevenLabsBridge._descriptor_buckets(controls),
+        )
 
+    @staticmethod
+    def _build_prompt_from(pairs: tuple, buckets: tuple) -> str:
+        """Build the prompt from precomputed prompt_pairs() and _descriptor_buckets()."""
         # Text prompts from the lens (sorted by weight descending)
-        if controls.prompts:
-            sorted_prompts = sorted(controls.prompts, key=lambda p: p.get("weight", 0), reverse=True)
-            for p in sorted_prompts:
-                parts.append(p.get("text", ""))
-
-        # BPM -> tempo descriptor
-        bpm = controls.bpm
-        if bpm < 80:
-            parts.append("slow tempo")
-        elif bpm < 110:
-            parts.append("moderate tempo")
-        elif bpm < 140:
-            parts.append("upbeat tempo")
-        else:
-            parts.append("fast energetic tempo")
-
-        # Density -> arrangement
-        if controls.density < 0.3:
-            parts.append("sparse minimal arrangement")
-        elif controls.density > 0.7:
-            parts.append("dense layered arrangement")
-
-        # Brightness -> tone
-        if controls.brightness < 0.3:
-            parts.append("dark muted tones")
-        elif controls.brightness > 0.7:
-            parts.append("bright shimmering tones")
-
-        # Scale -> key / mood
-        scale_map = {
-            "C_MAJOR_A_MINOR": "C major, uplifting mood",
-            "D_MAJOR_B_MINOR": "D major, bright joyful mood",
-            "A_FLAT_MAJOR_F_MINOR": "F minor, melancholic mood",
-            "G_FLAT_MAJOR_E_FLAT_MINOR": "E-flat minor, dark brooding mood",
-        }
-        if controls.scale in scale_map:
-            parts.append(scale_map[controls.scale])
-
-        # Mute flags
-        if controls.mute_bass:
-            parts.append("no bass")
-        if controls.mute_drums:
-            parts.append("no drums")
-
-        # Temperature -> experimental vs structured
-        if controls.temperature > 2.0:
-            parts.append("experimental, unconventional")
-        elif controls.temperature < 0.5:
-            parts.append("structured, predictable")
-
-        parts.append("instrumental")
-
-        return ", ".join(p for p in parts if p)
+        parts = [text for text, _weight in sorted(pairs, key=itemgetter(1), reverse=True) if text]
+        parts.append(_descriptor_suffix(*buckets))
+        return ", ".join(parts)
 
     # ── generation loop ─────────────────────────────────────────────────
 
@@ -23,6 +23,13 @@ class ControlState:
     mute_drums: bool = False
     temperature: float = 1.1          # 0.0-3.0
 
+    def prompt_pairs(self) -> tuple[tuple[str, float], ...]:
+        """Return prompts as a hashable tuple of (text, weight) pairs.
+
+        Missing text defaults to "" and missing weight to 0.0.
+        """
+        return tuple((p.get("text", ""), p.get("weight", 0.0)) for p in self.prompts)
+
     def clamped(self) -> ControlState:
         """Return a copy with all values clamped to valid Lyria ranges."""
         return ControlState(
@@ -39,6 +46,8 @@ class ControlState:
 
     def diff(self, other: ControlState) -> dict:
         """Return dict of fields that changed between self and other."""
+        if self is other:
+            return {}
         changes = {}
         if self.bpm != other.bpm:
             changes["bpm"] = self.bpm
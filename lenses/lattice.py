@@ -81,8 +81,7 @@ class LatticeLens(Lens):
 
             # Step multiple times per tick, scaled by speed
             steps = max(1, int(10 * self._params["speed"]))
-            for _ in range(steps):
-                self._lorenz.step()
+            self._lorenz.step_n(steps)
 
             x, y, z = self._lorenz.x, self._lorenz.y, self._lorenz.z
             amplitude = min(1.0, math.sqrt(x*x + y*y + z*z) / 50.0)
@@ -96,7 +95,7 @@ class LatticeLens(Lens):
                 "amplitude": round(amplitude, 3),
                 "chaos_level": round(chaos_level, 3),
                 "trail": [(round(p[0], 2), round(p[1], 2), round(p[2], 2))
-                          for p in self._lorenz._trail[-100:]],
+                          for p in self._lorenz.recent(100)],
             }
         else:
             return self._sim.tick(
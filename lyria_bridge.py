@@ -9,10 +9,83 @@ import random
 import struct
 import time
 from dataclasses import dataclass, field
+from functools import cache
 
 from lenses.base import ControlState
 
 
+# Unit-normal samples shared by every MockAudioGenerator: about 1.37 s of a
+# single stream at 48 kHz, half that with both LFO jitter and noise drawing.
+# Each chunk starts its walk at a seeded random offset so the noise floor
+# never settles into an audible loop.
+_NOISE_POOL_SIZE = 1 << 16
+
+
+@cache
+def _gaussian_pool(seed: int) -> tuple[float, ...]:
+    """Unit-normal samples from a seeded RNG, generated once per seed."""
+    rng = random.Random(seed)
+    return tuple(rng.gauss(0.0, 1.0) for _ in range(_NOISE_POOL_SIZE))
+
+
+def _scale_mask(scale_notes: set[int]) -> int:
+    """Pack a set of pitch classes (0-11) into a 12-bit mask."""
+    mask = 0
+    for pc in scale_notes:
+        mask |= 1 << pc
+    return mask
+
+
+def _snap_offset(pitch_class: int, mask: int) -> int:
+    """Signed semitone offset from pitch_class to the nearest pitch class in mask.
+
+    Ties go to the lower pitch class.
+    """
+    # Find the nearest pitch class in the scale (wrapping around octave)
+    best_dist = 12
+    best_pc = pitch_class
+    for pc in range(12):
+        if mask >> pc & 1:
+            dist = min(abs(pc - pitch_class), 12 - abs(pc - pitch_class))
+            if dist < best_dist:
+                best_dist = dist
+                best_pc = pc
+
+    # Compute signed offset to snap to the chosen pitch class
+    diff = best_pc - pitch_class
+    if diff > 6:
+        diff -= 12
+    elif diff < -6:
+        diff += 12
+    return diff
+
+
+@cache
+def _snap_table(mask: int) -> tuple[int, ...]:
+    """Snap offsets for all 12 pitch classes of a scale, indexed by pitch class.
+
+    Snapping is octave-invariant, so one 12-entry table covers every MIDI note.
+    """
+    return tuple(_snap_offset(pc, mask) for pc in range(12))
+
+
+def _snap_freq(freq: float, table: tuple[int, ...]) -> float:
+    """Snap a positive frequency to the nearest scale tone using a snap table.
+
+    Uses equal temperament: f(n) = 440 * 2^((n - 69) / 12).
+    """
+    midi_rounded = round(69.0 + 12.0 * math.log2(freq / 440.0))
+    quantized_midi = midi_rounded + table[midi_rounded % 12]
+    return 440.0 * (2.0 ** ((quantized_midi - 69) / 12.0))
+
+
+def _quantize_batch(freqs: list[float], scale_notes: set[int] | int) -> list[float]:
+    """Quantize many positive frequencies to one scale, resolving its table once."""
+    mask = scale_notes if isinstance(scale_notes, int) else _scale_mask(scale_notes)
+    table = _snap_table(mask)
+    return [_snap_freq(f, table) for f in freqs]
+
+
 class MockAudioGenerator:
     """Additive synthesizer driven by ControlState. No Lyria dependency.
 
@@ -38,6 +111,16 @@ class MockAudioGenerator:
         "G_FLAT_MAJOR_E_FLAT_MINOR": {1, 3, 5, 6, 8, 10, 11},
     }
 
+    # Same scales as 12-bit masks (bit n set = pitch class n in scale)
+    SCALE_MASKS: dict[str, int] = {
+        name: _scale_mask(notes) for name, notes in SCALE_NOTES.items()
+    }
+
+    # Per-scale snap offsets, built once at import (see _snap_table)
+    SCALE_SNAP_TABLES: dict[str, tuple[int, ...]] = {
+        name: _snap_table(mask) for name, mask in SCALE_MASKS.items()
+    }
+
     def __init__(self, sample_rate: int = 48000, channels: int = 2) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
@@ -52,36 +135,19 @@ class MockAudioGenerator:
         self._noise_level = 0.0
         self._mute_drums = False
         self._rng = random.Random(42)
+        self._noise_pool = _gaussian_pool(42)
+        self._noise_cursor = 0
 
-    def _quantize_to_scale(self, freq: float, scale_notes: set[int] | None) -> float:
+    def _quantize_to_scale(self, freq: float, scale_notes: set[int] | int | None) -> float:
         """Snap a frequency to the nearest pitch in the given scale.
 
+        The scale is a set of pitch classes or a 12-bit mask (see SCALE_MASKS).
         Uses equal temperament: f(n) = 440 * 2^((n - 69) / 12).
         """
         if scale_notes is None or freq <= 0:
             return freq
-        midi = 69.0 + 12.0 * math.log2(freq / 440.0)
-        midi_rounded = round(midi)
-        pitch_class = midi_rounded % 12
-
-        # Find the nearest pitch class in the scale (wrapping around octave)
-        best_dist = 12
-        best_pc = pitch_class
-        for pc in scale_notes:
-            dist = min(abs(pc - pitch_class), 12 - abs(pc - pitch_class))
-            if dist < best_dist:
-                best_dist = dist
-                best_pc = pc
-
-        # Compute signed offset to snap to the chosen pitch class
-        diff = best_pc - pitch_class
-        if diff > 6:
-            diff -= 12
-        elif diff < -6:
-            diff += 12
-        quantized_midi = midi_rounded + diff
-
-        return 440.0 * (2.0 ** ((quantized_midi - 69) / 12.0))
+        mask = scale_notes if isinstance(scale_notes, int) else _scale_mask(scale_notes)
+        return _snap_freq(freq, _snap_table(mask))
 
     def update_from_controls(self, controls: ControlState) -> None:
         """Update synth parameters from ControlState.
@@ -92,8 +158,11 @@ class MockAudioGenerator:
         raw_freq = 110 + controls.brightness * 330
 
         # scale -> quantize frequency to nearest note in the active scale
-        scale_notes = self.SCALE_NOTES.get(controls.scale)
-        self._target_freq = self._quantize_to_scale(raw_freq, scale_notes)
+        table = self.SCALE_SNAP_TABLES.get(controls.scale)
+        if table is None or raw_freq <= 0:
+            self._target_freq = raw_freq
+        else:
+            self._target_freq = _snap_freq(raw_freq, table)
 
         # density -> number of harmonics (1 = pure sine, 6 = rich timbre)
         n_harmonics = 1 + int(controls.density * 5)
@@ -121,45 +190,96 @@ class MockAudioGenerator:
         # mute_drums -> suppress the LFO (the rhythmic element of the synth)
         self._mute_drums = controls.mute_drums
 
+    def _take_gaussians(self, count: int) -> list[float]:
+        """Next count unit-normal samples from the pool, wrapping at the end."""
+        pool = self._noise_pool
+        cursor = self._noise_cursor
+        out: list[float] = []
+        while count > 0:
+            take = min(count, len(pool) - cursor)
+            out += pool[cursor:cursor + take]
+            cursor = (cursor + take) % len(pool)
+            count -= take
+        self._noise_cursor = cursor
+        return out
+
     def generate_chunk(self, num_samples: int = 2400) -> bytes:
         """Generate a chunk of 16-bit PCM audio."""
-        freq_step = (self._target_freq - self._freq) * 0.01
-        samples = []
-
-        for _ in range(num_samples):
-            self._freq += freq_step * 0.001
-            self._lfo_phase += self._lfo_rate / self.sample_rate
+        # Hoist everything the sample loop touches into locals: attribute and
+        # global lookups cost more than the arithmetic in this loop.
+        sin = math.sin
+        tau = math.tau
+        sample_rate = self.sample_rate
+        # Fold master volume and int16 full scale into the per-chunk
+        # amplitudes so each sample needs only the LFO multiply.
+        full_scale = self._volume * 32767
+        harmonics = [(mult, amp * full_scale) for mult, amp in self._harmonics]
+        noise_level = self._noise_level
+        noise_amp = noise_level * full_scale
+        mute_drums = self._mute_drums
+        half_depth = self._lfo_depth * 0.5
+        jitter_scale = (1.0 - self._lfo_depth) * 0.3
+        lfo_step = self._lfo_rate / sample_rate
+        radians_per_hz = tau / sample_rate
+        glide = (self._target_freq - self._freq) * 0.01 * 0.001
+        phase_wrap = tau * 1000
+
+        freq = self._freq
+        phase = self._phase
+        lfo_phase = self._lfo_phase
+        mono = [0] * num_samples
+
+        # Gaussian draws come from the shared seeded pool rather than one
+        # random.gauss() call (pure Python) per use. One RNG call per chunk
+        # picks where in the pool this chunk's block starts.
+        self._noise_cursor = self._rng.randrange(len(self._noise_pool))
+        jitter_z = iter(self._take_gaussians(0 if mute_drums else num_samples)).__next__
+        noise_z = iter(self._take_gaussians(num_samples if noise_level > 0 else 0)).__next__
+
+        for i in range(num_samples):
+            freq += glide
+            lfo_phase += lfo_step
 
             # LFO: rhythmic amplitude modulation
-            if self._mute_drums:
+            if mute_drums:
                 lfo = 1.0  # flat envelope, no rhythmic pulsing
             else:
-                lfo_raw = math.sin(self._lfo_phase * math.tau)
+                lfo_raw = sin(lfo_phase * tau)
                 # Guidance controls depth: high guidance = deep regular pulse
                 # Low guidance adds jitter (irregularity)
-                jitter = (1.0 - self._lfo_depth) * self._rng.gauss(0, 0.3)
-                lfo = 0.5 + self._lfo_depth * 0.5 * lfo_raw + jitter
+                jitter = jitter_scale * jitter_z()
+                lfo = 0.5 + half_depth * lfo_raw + jitter
                 lfo = max(0.1, min(1.0, lfo))
 
             # Additive synthesis
             value = 0.0
-            for harmonic_mult, harmonic_amp in self._harmonics:
-                value += harmonic_amp * math.sin(self._phase * harmonic_mult)
+            for harmonic_mult, harmonic_amp in harmonics:
+                value += harmonic_amp * sin(phase * harmonic_mult)
 
             # Temperature-controlled noise floor
-            if self._noise_level > 0:
-                value += self._rng.gauss(0, self._noise_level)
+            if noise_level > 0:
+                value += noise_amp * noise_z()
 
-            value *= self._volume * lfo
-            self._phase += math.tau * self._freq / self.sample_rate
+            phase += freq * radians_per_hz
 
-            if self._phase > math.tau * 1000:
-                self._phase -= math.tau * 1000
+            if phase > phase_wrap:
+                phase -= phase_wrap
 
-            sample_int = max(-32767, min(32767, int(value * 32767)))
-            for _ in range(self.channels):
-                samples.append(sample_int)
+            mono[i] = max(-32767, min(32767, int(value * lfo)))
 
+        self._freq = freq
+        self._phase = phase
+        self._lfo_phase = lfo_phase
+
+        # Interleave: every channel carries the same mono signal. Strided
+        # slice assignment copies in C instead of a per-sample comprehension.
+        channels = self.channels
+        if channels == 1:
+            samples = mono
+        else:
+            samples = [0] * (num_samples * channels)
+            for c in range(channels):
+                samples[c::channels] = mono
         return struct.pack(f"<{len(samples)}h", *samples)
 
 
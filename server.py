@@ -12,6 +12,7 @@ import os
 import time
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -211,18 +212,27 @@ async def index():
     return FileResponse("static/index.html")
 
 
+@lru_cache(maxsize=1)
+def lens_catalog() -> dict:
+    """Name, description and parameters of every lens.
+
+    Built once: all three are class attributes, so no lens is instantiated.
+    Callers must treat the result as read-only.
+    """
+    return {
+        name: {
+            "name": name,
+            "description": cls.description,
+            "parameters": cls.parameters,
+        }
+        for name, cls in LENSES.items()
+    }
+
+
 @app.get("/api/lenses")
 async def get_lenses():
     """Return available lenses and their parameters."""
-    result = {}
-    for name, cls in LENSES.items():
-        lens = cls()
-        result[name] = {
-            "name": name,
-            "description": lens.description,
-            "parameters": lens.parameters,
-        }
-    return result
+    return lens_catalog()
 
 
 @app.websocket("/ws")
@@ -238,8 +248,8 @@ async def websocket_endpoint(ws: WebSocket):
         "type": "init",
         "lens": active_lens_name,
         "lenses": {
-            name: {"description": cls().description, "parameters": cls().parameters}
-            for name, cls in LENSES.items()
+            name: {"description": info["description"], "parameters": info["parameters"]}
+            for name, info in lens_catalog().items()
         },
         "is_mock": bridge.is_mock,
         "backend": get_backend_name(),
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 
-from lenses.base import ControlState
+from lenses import LENSES
+from lenses.base import ControlState, Lens
 from lenses.atmosphere import AtmosphereLens
 from lenses.pulse import PulseLens
 from lenses.lattice import LatticeLens
@@ -22,6 +26,15 @@ from data_sources.simulators import (
 # ── ControlState fixtures ───────────────────────────────────────────────
 
 
+def assert_controls_clamped(controls: ControlState) -> None:
+    """Assert every numeric ControlState field is within its Lyria range."""
+    assert 60 <= controls.bpm <= 200
+    assert 0.0 <= controls.density <= 1.0
+    assert 0.0 <= controls.brightness <= 1.0
+    assert 0.0 <= controls.guidance <= 6.0
+    assert 0.0 <= controls.temperature <= 3.0
+
+
 @pytest.fixture
 def default_controls() -> ControlState:
     """ControlState with all default values."""
@@ -55,50 +68,124 @@ def extreme_high_controls() -> ControlState:
 # ── Lens fixtures ───────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def all_lenses() -> dict[str, Lens]:
+    """One instance of every registered lens, shared for the whole session.
+
+    Only for tests that read state or run a single update(); tests that
+    call set_param / set_live_data use the *_lens_fresh fixtures below.
+    """
+    return {name: cls() for name, cls in LENSES.items()}
+
+
+# Module-scoped lenses are shared by every test in a file. map() advances
+# their EMA state, so only use them where the assertion doesn't depend on
+# smoothing history (names, scales, prompts, key sets, types).
+
+
+@pytest.fixture(scope="module")
 def atmosphere_lens() -> AtmosphereLens:
     return AtmosphereLens()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pulse_lens() -> PulseLens:
     return PulseLens()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def lattice_lens() -> LatticeLens:
     return LatticeLens()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def flow_lens() -> FlowLens:
     return FlowLens()
 
 
+@pytest.fixture
+def atmosphere_lens_fresh() -> AtmosphereLens:
+    """Per-test AtmosphereLens for tests that mutate params, live data or EMA state."""
+    return AtmosphereLens()
+
+
+# ── Lens tick snapshots ─────────────────────────────────────────────────
+# tick(0.0) of a freshly built lens, computed once per session. Wrapped in a
+# read-only mapping so no test can mutate the shared snapshot.
+
+
+@pytest.fixture(scope="session")
+def atmosphere_tick0() -> Mapping:
+    return MappingProxyType(AtmosphereLens().tick(0.0))
+
+
+@pytest.fixture(scope="session")
+def pulse_tick0() -> Mapping:
+    return MappingProxyType(PulseLens().tick(0.0))
+
+
+@pytest.fixture(scope="session")
+def lattice_tick0() -> Mapping:
+    return MappingProxyType(LatticeLens().tick(0.0))
+
+
+@pytest.fixture(scope="session")
+def flow_tick0() -> Mapping:
+    return MappingProxyType(FlowLens().tick(0.0))
+
+
 # ── Simulator fixtures ──────────────────────────────────────────────────
+# Class-scoped: each test class shares one instance, so tests must not
+# assume a pristine simulator. Use lorenz_fresh for initial-state checks.
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def weather_sim() -> WeatherSimulator:
     return WeatherSimulator(seed=42)
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def weather_columns() -> dict[str, list[float]]:
+    """Columns from one 500-tick (0.1 s step) seed-42 weather run."""
+    return WeatherSimulator(seed=42).tick_batch(t * 0.1 for t in range(500))
+
+
+@pytest.fixture(scope="class")
 def cardiac_sim() -> CardiacSimulator:
     return CardiacSimulator(resting_hr=72.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def cardiac_sweep() -> list[dict]:
+    """200 resting ticks (0.01 s step) from one CardiacSimulator."""
+    sim = CardiacSimulator(resting_hr=72.0)
+    return [sim.tick(i * 0.01) for i in range(200)]
+
+
+@pytest.fixture(scope="class")
+def cardiac_stress_sweep() -> list[dict]:
+    """100 ticks (0.1 s step) at full exercise and stress."""
+    sim = CardiacSimulator(resting_hr=72.0)
+    return [sim.tick(i * 0.1, exercise_level=1.0, stress=1.0) for i in range(100)]
+
+
+@pytest.fixture(scope="class")
 def lorenz() -> LorenzAttractor:
     return LorenzAttractor()
 
 
 @pytest.fixture
+def lorenz_fresh() -> LorenzAttractor:
+    """Per-test LorenzAttractor for tests that check the initial state or trail length."""
+    return LorenzAttractor()
+
+
+@pytest.fixture(scope="class")
 def math_sim() -> MathSimulator:
     return MathSimulator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def network_sim() -> NetworkSimulator:
     return NetworkSimulator(base_rate=50.0)
 
@@ -41,36 +41,45 @@ class TestControlStateDefaults:
         assert default_controls.temperature == 1.1
 
 
-# ── clamped() range enforcement ─────────────────────────────────────────
+# ── prompt_pairs() ──────────────────────────────────────────────────────
 
 
-class TestControlStateClamped:
-    """Verify clamped() enforces Lyria-valid ranges."""
+class TestControlStatePromptPairs:
+    """Verify prompt_pairs() normalises prompts to (text, weight) tuples."""
+
+    def test_default_prompt_pairs(self, default_controls: ControlState) -> None:
+        assert default_controls.prompt_pairs() == (("ambient", 1.0),)
+
+    def test_pairs_are_hashable(self) -> None:
+        cs = ControlState(prompts=[{"text": "a", "weight": 0.5}, {"text": "b", "weight": 1.0}])
+        assert hash(cs.prompt_pairs()) == hash((("a", 0.5), ("b", 1.0)))
 
-    def test_bpm_clamped_low(self) -> None:
-        cs = ControlState(bpm=0).clamped()
-        assert cs.bpm == 60
+    def test_missing_keys_default(self) -> None:
+        cs = ControlState(prompts=[{"text": "only text"}, {"weight": 0.3}])
+        assert cs.prompt_pairs() == (("only text", 0.0), ("", 0.3))
 
-    def test_bpm_clamped_high(self) -> None:
-        cs = ControlState(bpm=999).clamped()
-        assert cs.bpm == 200
+    def test_empty_prompts(self) -> None:
+        assert ControlState(prompts=[]).prompt_pairs() == ()
 
-    def test_bpm_within_range_unchanged(self) -> None:
-        cs = ControlState(bpm=120).clamped()
-        assert cs.bpm == 120
 
-    def test_bpm_boundary_low(self) -> None:
-        cs = ControlState(bpm=60).clamped()
-        assert cs.bpm == 60
+# ── clamped() range enforcement ─────────────────────────────────────────
 
-    def test_bpm_boundary_high(self) -> None:
-        cs = ControlState(bpm=200).clamped()
-        assert cs.bpm == 200
 
-    def test_bpm_clamped_is_int(self) -> None:
-        cs = ControlState(bpm=120.7).clamped()
+class TestControlStateClamped:
+    """Verify clamped() enforces Lyria-valid ranges."""
+
+    @pytest.mark.parametrize("bpm,expected", [
+        (0, 60),        # below range
+        (999, 200),     # above range
+        (120, 120),     # within range, unchanged
+        (60, 60),       # lower boundary
+        (200, 200),     # upper boundary
+        (120.7, 120),   # fractional BPM truncated to int
+    ])
+    def test_bpm_clamped(self, bpm: float, expected: int) -> None:
+        cs = ControlState(bpm=bpm).clamped()
         assert isinstance(cs.bpm, int)
-        assert cs.bpm == 120
+        assert cs.bpm == expected
 
     def test_density_clamped_low(self) -> None:
         cs = ControlState(density=-0.5).clamped()
@@ -172,6 +181,10 @@ class TestControlStateDiff:
         b = ControlState()
         assert a.diff(b) == {}
 
+    def test_same_instance_empty_diff(self) -> None:
+        a = ControlState(bpm=90, scale="C_MAJOR_A_MINOR")
+        assert a.diff(a) == {}
+
     def test_bpm_change_detected(self) -> None:
         a = ControlState(bpm=120)
         b = ControlState(bpm=121)
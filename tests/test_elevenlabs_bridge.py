@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from lenses.base import ControlState
-from elevenlabs_bridge import ElevenLabsBridge
+from elevenlabs_bridge import ElevenLabsBridge, _descriptor_suffix
 
 
 # ── _build_prompt() ────────────────────────────────────────────────────
@@ -202,6 +202,64 @@ class TestBuildPrompt:
         result = ElevenLabsBridge._build_prompt(cs)
         assert "test" in result
 
+    def test_descriptor_suffix_cached_per_bucket(self) -> None:
+        """States in the same buckets share one cached descriptor string."""
+        a = _descriptor_suffix(*ElevenLabsBridge._descriptor_buckets(ControlState(bpm=90)))
+        b = _descriptor_suffix(*ElevenLabsBridge._descriptor_buckets(ControlState(bpm=100)))
+        assert a is b
+
+    def test_prompt_text_prefixes_descriptors(self) -> None:
+        cs = ControlState(bpm=70, prompts=[{"text": "drone", "weight": 1.0}])
+        result = ElevenLabsBridge._build_prompt(cs)
+        assert result.startswith("drone, slow tempo")
+
+
+# ── _prompt_fingerprint() ──────────────────────────────────────────────
+
+
+class TestPromptFingerprint:
+    """Verify the fingerprint tracks exactly the prompt-relevant state."""
+
+    def test_same_bucket_same_fingerprint(self) -> None:
+        a = ElevenLabsBridge._prompt_fingerprint(ControlState(bpm=112, density=0.4))
+        b = ElevenLabsBridge._prompt_fingerprint(ControlState(bpm=135, density=0.6))
+        assert a == b
+
+    @pytest.mark.parametrize("low,high", [
+        (ControlState(bpm=79), ControlState(bpm=80)),
+        (ControlState(density=0.29), ControlState(density=0.3)),
+        (ControlState(brightness=0.7), ControlState(brightness=0.71)),
+        (ControlState(temperature=0.49), ControlState(temperature=0.5)),
+        (ControlState(scale="C_MAJOR_A_MINOR"), ControlState(scale="D_MAJOR_B_MINOR")),
+        (ControlState(mute_drums=False), ControlState(mute_drums=True)),
+        (ControlState(prompts=[{"text": "a", "weight": 1.0}]),
+         ControlState(prompts=[{"text": "b", "weight": 1.0}])),
+    ])
+    def test_threshold_crossing_changes_fingerprint(
+        self, low: ControlState, high: ControlState,
+    ) -> None:
+        assert ElevenLabsBridge._prompt_fingerprint(low) != ElevenLabsBridge._prompt_fingerprint(high)
+        assert ElevenLabsBridge._build_prompt(low) != ElevenLabsBridge._build_prompt(high)
+
+    async def test_update_skips_unchanged_fingerprint(self) -> None:
+        bridge = ElevenLabsBridge()
+        bridge._use_mock = False
+        bridge._connected = True
+        await bridge.update(ControlState(density=0.4))
+        assert bridge._pending_prompt
+        bridge._pending_prompt = ""
+        await bridge.update(ControlState(density=0.6))
+        assert bridge._pending_prompt == ""
+
+    async def test_reset_clears_fingerprint(self) -> None:
+        bridge = ElevenLabsBridge()
+        bridge._use_mock = False
+        bridge._connected = True
+        await bridge.update(ControlState())
+        await bridge.reset()
+        await bridge.update(ControlState())
+        assert bridge._pending_prompt == ElevenLabsBridge._build_prompt(ControlState())
+
 
 # ── Debounce constants ──────────────────────────────────────────────────
 
@@ -8,7 +8,20 @@ import struct
 import pytest
 
 from lenses.base import ControlState
-from lyria_bridge import MockAudioGenerator
+from lyria_bridge import MockAudioGenerator, _quantize_batch, _scale_mask, _snap_offset
+
+
+def _midi_to_freq(midi: int) -> float:
+    return 440.0 * (2.0 ** ((midi - 69) / 12.0))
+
+
+def _freq_to_pitch_class(freq: float) -> int:
+    midi = 69.0 + 12.0 * math.log2(freq / 440.0)
+    return round(midi) % 12
+
+
+# C3..B5, shared by the quantization sweeps
+_SWEEP_FREQS = [_midi_to_freq(midi) for midi in range(48, 84)]
 
 
 # ── PCM output format ──────────────────────────────────────────────────
@@ -80,49 +93,21 @@ class TestMockAudioPCMFormat:
 class TestScaleQuantization:
     """Verify frequencies snap to the correct pitch classes."""
 
-    def _midi_to_freq(self, midi: int) -> float:
-        return 440.0 * (2.0 ** ((midi - 69) / 12.0))
-
-    def _freq_to_pitch_class(self, freq: float) -> int:
-        midi = 69.0 + 12.0 * math.log2(freq / 440.0)
-        return round(midi) % 12
-
-    def test_quantize_c_major_snaps_correctly(self, mock_audio: MockAudioGenerator) -> None:
-        """Frequencies quantized to C Major should have pitch classes in {0,2,4,5,7,9,11}."""
-        c_major = {0, 2, 4, 5, 7, 9, 11}
-        # Test a range of frequencies
-        for midi in range(48, 84):
-            freq = self._midi_to_freq(midi)
-            quantized = mock_audio._quantize_to_scale(freq, c_major)
-            pc = self._freq_to_pitch_class(quantized)
-            assert pc in c_major, f"MIDI {midi} -> freq {freq} -> quantized {quantized} -> PC {pc} not in C Major"
-
-    def test_quantize_d_major_snaps_correctly(self, mock_audio: MockAudioGenerator) -> None:
-        """Frequencies quantized to D Major should have correct pitch classes."""
-        d_major = {1, 2, 4, 6, 7, 9, 11}
-        for midi in range(48, 84):
-            freq = self._midi_to_freq(midi)
-            quantized = mock_audio._quantize_to_scale(freq, d_major)
-            pc = self._freq_to_pitch_class(quantized)
-            assert pc in d_major, f"MIDI {midi} -> PC {pc} not in D Major"
-
-    def test_quantize_ab_major_snaps_correctly(self, mock_audio: MockAudioGenerator) -> None:
-        """Ab Major scale quantization."""
-        ab_major = {0, 1, 3, 5, 7, 8, 10}
-        for midi in range(48, 84):
-            freq = self._midi_to_freq(midi)
-            quantized = mock_audio._quantize_to_scale(freq, ab_major)
-            pc = self._freq_to_pitch_class(quantized)
-            assert pc in ab_major, f"MIDI {midi} -> PC {pc} not in Ab Major"
-
-    def test_quantize_gb_major_snaps_correctly(self, mock_audio: MockAudioGenerator) -> None:
-        """Gb Major scale quantization."""
-        gb_major = {1, 3, 5, 6, 8, 10, 11}
-        for midi in range(48, 84):
-            freq = self._midi_to_freq(midi)
-            quantized = mock_audio._quantize_to_scale(freq, gb_major)
-            pc = self._freq_to_pitch_class(quantized)
-            assert pc in gb_major, f"MIDI {midi} -> PC {pc} not in Gb Major"
+    @pytest.mark.parametrize("scale_notes", [
+        pytest.param({0, 2, 4, 5, 7, 9, 11}, id="c_major"),
+        pytest.param({1, 2, 4, 6, 7, 9, 11}, id="d_major"),
+        pytest.param({0, 1, 3, 5, 7, 8, 10}, id="ab_major"),
+        pytest.param({1, 3, 5, 6, 8, 10, 11}, id="gb_major"),
+    ])
+    @pytest.mark.parametrize("midi", range(48, 84))
+    def test_quantize_snaps_correctly(
+        self, mock_audio: MockAudioGenerator, scale_notes: set[int], midi: int,
+    ) -> None:
+        """Every note from C3 to B5 should quantize onto a scale pitch class."""
+        freq = _midi_to_freq(midi)
+        quantized = mock_audio._quantize_to_scale(freq, scale_notes)
+        pc = _freq_to_pitch_class(quantized)
+        assert pc in scale_notes, f"MIDI {midi} -> freq {freq} -> quantized {quantized} -> PC {pc}"
 
     def test_quantize_no_scale_passthrough(self, mock_audio: MockAudioGenerator) -> None:
         """With no scale (None), frequency should pass through unchanged."""
@@ -146,6 +131,38 @@ class TestScaleQuantization:
         result = mock_audio._quantize_to_scale(440.0, c_major)
         assert abs(result - 440.0) < 0.01
 
+    @pytest.mark.parametrize("scale", sorted(MockAudioGenerator.SCALE_NOTES))
+    def test_snap_table_lands_in_scale(self, scale: str) -> None:
+        """Every pitch class plus its table offset is a scale tone."""
+        notes = MockAudioGenerator.SCALE_NOTES[scale]
+        table = MockAudioGenerator.SCALE_SNAP_TABLES[scale]
+        assert all((pc + table[pc]) % 12 in notes for pc in range(12))
+
+    @pytest.mark.parametrize("scale", sorted(MockAudioGenerator.SCALE_NOTES))
+    def test_batch_matches_scalar(self, mock_audio: MockAudioGenerator, scale: str) -> None:
+        """Quantizing the whole sweep at once matches note-by-note quantization."""
+        notes = MockAudioGenerator.SCALE_NOTES[scale]
+        quantized = _quantize_batch(_SWEEP_FREQS, MockAudioGenerator.SCALE_MASKS[scale])
+        assert quantized == [mock_audio._quantize_to_scale(f, notes) for f in _SWEEP_FREQS]
+        assert {_freq_to_pitch_class(f) for f in quantized} <= notes
+
+    @pytest.mark.parametrize("scale", sorted(MockAudioGenerator.SCALE_NOTES))
+    def test_mask_matches_set(self, mock_audio: MockAudioGenerator, scale: str) -> None:
+        """Passing the scale as a bitmask quantizes exactly like the set form."""
+        notes = MockAudioGenerator.SCALE_NOTES[scale]
+        mask = MockAudioGenerator.SCALE_MASKS[scale]
+        for grid_freq in _SWEEP_FREQS:
+            freq = grid_freq * 1.01  # off-grid so snapping does work
+            assert mock_audio._quantize_to_scale(freq, mask) == mock_audio._quantize_to_scale(freq, notes)
+
+    def test_snap_offset_tie_goes_lower(self) -> None:
+        """C# is equidistant from C and D; the lower pitch class wins."""
+        assert _snap_offset(1, _scale_mask({0, 2})) == -1
+
+    def test_snap_offset_wraps_octave(self) -> None:
+        """B snaps up to C across the octave boundary, not down 11 semitones."""
+        assert _snap_offset(11, _scale_mask({0, 5})) == 1
+
 
 # ── update_from_controls applies all 8 fields ──────────────────────────
 
@@ -236,9 +253,15 @@ class TestUpdateFromControls:
         ))
         freq = mock_audio._target_freq
         # Should be quantized to a C Major pitch class
-        midi = 69.0 + 12.0 * math.log2(freq / 440.0)
-        pc = round(midi) % 12
-        assert pc in {0, 2, 4, 5, 7, 9, 11}
+        assert _freq_to_pitch_class(freq) in {0, 2, 4, 5, 7, 9, 11}
+
+    def test_non_positive_freq_with_scale_passthrough(self, mock_audio: MockAudioGenerator) -> None:
+        """A non-positive raw frequency is passed through even when a scale is set."""
+        mock_audio.update_from_controls(ControlState(
+            brightness=-0.5, scale="C_MAJOR_A_MINOR",
+        ))
+        # raw_freq = 110 + -0.5 * 330 = -55
+        assert mock_audio._target_freq == -55.0
 
     def test_unknown_scale_no_quantization(self, mock_audio: MockAudioGenerator) -> None:
         """Unknown scale should not quantize (passthrough)."""
@@ -272,3 +295,32 @@ class TestMockAudioDeterminism:
         chunk1 = gen1.generate_chunk(num_samples=2400)
         chunk2 = gen2.generate_chunk(num_samples=2400)
         assert chunk1 == chunk2
+
+    def test_noisy_output_deterministic(self) -> None:
+        """Noise and LFO jitter come from the seeded pool, so they repeat too."""
+        controls = ControlState(temperature=3.0, guidance=0.0)
+        gen1 = MockAudioGenerator()
+        gen2 = MockAudioGenerator()
+        gen1.update_from_controls(controls)
+        gen2.update_from_controls(controls)
+        assert gen1.generate_chunk(num_samples=2400) == gen2.generate_chunk(num_samples=2400)
+
+    def test_noise_pool_wraps(self) -> None:
+        gen = MockAudioGenerator()
+        pool = gen._noise_pool
+        gen._noise_cursor = len(pool) - 3
+        assert gen._take_gaussians(5) == [*pool[-3:], *pool[:2]]
+        assert gen._noise_cursor == 2
+
+    def test_noise_walk_not_periodic(self) -> None:
+        """Blocks a full pool length apart must not repeat the same samples."""
+        gen = MockAudioGenerator()
+        gen.update_from_controls(ControlState(temperature=3.0, guidance=0.0))
+        blocks: list[list[float]] = []
+        take = gen._take_gaussians
+        gen._take_gaussians = lambda count: blocks.append(take(count)) or blocks[-1]
+        # 4096 jitter + 4096 noise samples per chunk: 8 chunks span the pool
+        chunks_per_pool = len(gen._noise_pool) // (2 * 4096)
+        for _ in range(chunks_per_pool + 1):
+            gen.generate_chunk(num_samples=4096)
+        assert blocks[0] != blocks[2 * chunks_per_pool]
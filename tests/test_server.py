@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator, Iterator
+from types import ModuleType
 
+import httpx
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
+from starlette.testclient import WebSocketTestSession
+
+from lyria_bridge import LyriaBridge
 
 
 # ── Module-level setup ──────────────────────────────────────────────────
@@ -15,52 +21,81 @@ from fastapi.testclient import TestClient
 # Also, we must import the app only after ensuring clean env.
 
 
-@pytest.fixture(autouse=True)
-def _clear_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Ensure no API keys are set during testing."""
-    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
-    monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+@pytest.fixture(scope="module", autouse=True)
+def _clear_env() -> Iterator[None]:
+    """Ensure no API keys are set while this module's tests run."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("GOOGLE_API_KEY", raising=False)
+        mp.delenv("ELEVENLABS_API_KEY", raising=False)
+        yield
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a FastAPI TestClient."""
-    # Import here to pick up monkeypatched env
-    from server import app
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def server_module(_clear_env: None) -> ModuleType:
+    """The server module, imported once after the env is cleared.
+
+    server builds its audio bridge at import time from the API key env vars,
+    so it can't be imported at the top of this file.
+    """
+    import server
+    return server
+
+
+@pytest.fixture(scope="module")
+def client(server_module: ModuleType) -> TestClient:
+    """One FastAPI TestClient shared by every test in this module."""
+    return TestClient(server_module.app)
 
 
 # ── HTTP endpoints ──────────────────────────────────────────────────────
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_client(server_module: ModuleType) -> AsyncIterator[httpx.AsyncClient]:
+    """In-process HTTP client for the plain JSON/HTML routes.
+
+    Talks to the ASGI app directly; TestClient is kept for the WebSocket
+    tests since httpx has no WebSocket support.
+    """
+    transport = httpx.ASGITransport(app=server_module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def lenses_dict(async_client: httpx.AsyncClient) -> dict:
+    """Parsed /api/lenses response, fetched once for the read-only checks."""
+    resp = await async_client.get("/api/lenses")
+    return resp.json()
+
+
 class TestHTTPEndpoints:
     """Test non-WebSocket HTTP endpoints."""
 
-    def test_index_returns_html(self, client: TestClient) -> None:
-        resp = client.get("/")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_index_returns_html(self, async_client: httpx.AsyncClient) -> None:
+        resp = await async_client.get("/")
         assert resp.status_code == 200
 
-    def test_api_lenses_returns_all_four(self, client: TestClient) -> None:
-        resp = client.get("/api/lenses")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_api_lenses_ok(self, async_client: httpx.AsyncClient) -> None:
+        resp = await async_client.get("/api/lenses")
         assert resp.status_code == 200
-        data = resp.json()
-        assert "atmosphere" in data
-        assert "pulse" in data
-        assert "lattice" in data
-        assert "flow" in data
-
-    def test_api_lenses_have_description(self, client: TestClient) -> None:
-        resp = client.get("/api/lenses")
-        data = resp.json()
-        for name, info in data.items():
+
+    def test_api_lenses_returns_all_four(self, lenses_dict: dict) -> None:
+        assert "atmosphere" in lenses_dict
+        assert "pulse" in lenses_dict
+        assert "lattice" in lenses_dict
+        assert "flow" in lenses_dict
+
+    def test_api_lenses_have_description(self, lenses_dict: dict) -> None:
+        for name, info in lenses_dict.items():
             assert "description" in info
             assert isinstance(info["description"], str)
             assert len(info["description"]) > 0
 
-    def test_api_lenses_have_parameters(self, client: TestClient) -> None:
-        resp = client.get("/api/lenses")
-        data = resp.json()
-        for name, info in data.items():
+    def test_api_lenses_have_parameters(self, lenses_dict: dict) -> None:
+        for name, info in lenses_dict.items():
             assert "parameters" in info
             assert isinstance(info["parameters"], list)
 
@@ -68,100 +103,95 @@ class TestHTTPEndpoints:
 # ── WebSocket endpoint ──────────────────────────────────────────────────
 
 
+@pytest.fixture
+def ws_connected(client: TestClient) -> Iterator[tuple[WebSocketTestSession, dict]]:
+    """An open /ws connection with its init message already read.
+
+    Function-scoped: tests pause/play and switch lenses, which changes
+    server state for whoever connects next.
+    """
+    with client.websocket_connect("/ws") as ws:
+        init = json.loads(ws.receive_text())
+        yield ws, init
+
+
 class TestWebSocket:
     """Test the /ws WebSocket endpoint."""
 
-    def test_connect_receives_init(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            assert data["type"] == "init"
-            assert "lens" in data
-            assert "lenses" in data
-            assert "backend" in data
-
-    def test_init_message_has_lenses_list(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            lenses = data["lenses"]
-            assert "atmosphere" in lenses
-            assert "pulse" in lenses
-            assert "lattice" in lenses
-            assert "flow" in lenses
-
-    def test_init_message_has_backend(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            assert data["backend"] in ("mock", "lyria", "elevenlabs")
-
-    def test_init_message_has_paused_state(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            assert "paused" in data
-            assert isinstance(data["paused"], bool)
-
-    def test_switch_lens(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            # Read init message
-            ws.receive_text()
-            # Send switch_lens
-            ws.send_text(json.dumps({
-                "type": "switch_lens",
-                "lens": "pulse",
-            }))
-            # The server processes the switch internally; no direct response expected
-            # but it should not error out
-
-    def test_set_param(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            ws.receive_text()
-            ws.send_text(json.dumps({
-                "type": "set_param",
-                "name": "wind_speed",
-                "value": 15.0,
-            }))
-            # Should not error out
-
-    def test_pause_and_play(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            ws.receive_text()
-
-            # Pause
-            ws.send_text(json.dumps({"type": "pause"}))
-            # Should receive paused broadcast
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            assert data["type"] == "paused"
-            assert data["paused"] is True
-
-            # Play
-            ws.send_text(json.dumps({"type": "play"}))
-            msg = ws.receive_text()
-            data = json.loads(msg)
-            assert data["type"] == "paused"
-            assert data["paused"] is False
-
-    def test_toggle_live_weather(self, client: TestClient) -> None:
-        with client.websocket_connect("/ws") as ws:
-            ws.receive_text()
-            ws.send_text(json.dumps({
-                "type": "toggle_live",
-                "enabled": True,
-            }))
-            # Should not error out
-
-    def test_switch_to_invalid_lens_no_crash(self, client: TestClient) -> None:
+    def test_connect_receives_init(self, ws_connected: tuple) -> None:
+        _ws, data = ws_connected
+        assert data["type"] == "init"
+        assert "lens" in data
+        assert "lenses" in data
+        assert "backend" in data
+
+    def test_init_message_has_lenses_list(self, ws_connected: tuple) -> None:
+        _ws, data = ws_connected
+        lenses = data["lenses"]
+        assert "atmosphere" in lenses
+        assert "pulse" in lenses
+        assert "lattice" in lenses
+        assert "flow" in lenses
+
+    def test_init_message_has_backend(self, ws_connected: tuple) -> None:
+        _ws, data = ws_connected
+        assert data["backend"] in ("mock", "lyria", "elevenlabs")
+
+    def test_init_message_has_paused_state(self, ws_connected: tuple) -> None:
+        _ws, data = ws_connected
+        assert "paused" in data
+        assert isinstance(data["paused"], bool)
+
+    def test_switch_lens(self, ws_connected: tuple) -> None:
+        ws, _init = ws_connected
+        ws.send_text(json.dumps({
+            "type": "switch_lens",
+            "lens": "pulse",
+        }))
+        # The server processes the switch internally; no direct response expected
+        # but it should not error out
+
+    def test_set_param(self, ws_connected: tuple) -> None:
+        ws, _init = ws_connected
+        ws.send_text(json.dumps({
+            "type": "set_param",
+            "name": "wind_speed",
+            "value": 15.0,
+        }))
+        # Should not error out
+
+    def test_pause_and_play(self, ws_connected: tuple) -> None:
+        ws, _init = ws_connected
+
+        # Pause
+        ws.send_text(json.dumps({"type": "pause"}))
+        # Should receive paused broadcast
+        data = json.loads(ws.receive_text())
+        assert data["type"] == "paused"
+        assert data["paused"] is True
+
+        # Play
+        ws.send_text(json.dumps({"type": "play"}))
+        data = json.loads(ws.receive_text())
+        assert data["type"] == "paused"
+        assert data["paused"] is False
+
+    def test_toggle_live_weather(self, ws_connected: tuple) -> None:
+        ws, _init = ws_connected
+        ws.send_text(json.dumps({
+            "type": "toggle_live",
+            "enabled": True,
+        }))
+        # Should not error out
+
+    def test_switch_to_invalid_lens_no_crash(self, ws_connected: tuple) -> None:
         """Switching to a non-existent lens should not crash."""
-        with client.websocket_connect("/ws") as ws:
-            ws.receive_text()
-            ws.send_text(json.dumps({
-                "type": "switch_lens",
-                "lens": "nonexistent_lens",
-            }))
-            # Should not error out; lens stays the same
+        ws, _init = ws_connected
+        ws.send_text(json.dumps({
+            "type": "switch_lens",
+            "lens": "nonexistent_lens",
+        }))
+        # Should not error out; lens stays the same
 
 
 # ── Server helpers ──────────────────────────────────────────────────────
@@ -170,27 +200,27 @@ class TestWebSocket:
 class TestServerHelpers:
     """Test module-level helpers."""
 
-    def test_create_lens_valid(self) -> None:
-        from server import create_lens
-        lens = create_lens("atmosphere")
+    def test_create_lens_valid(self, server_module: ModuleType) -> None:
+        lens = server_module.create_lens("atmosphere")
         assert lens.name == "atmosphere"
 
-    def test_create_lens_invalid_falls_back(self) -> None:
-        from server import create_lens
-        lens = create_lens("nonexistent")
+    def test_create_lens_invalid_falls_back(self, server_module: ModuleType) -> None:
+        lens = server_module.create_lens("nonexistent")
         assert lens.name == "atmosphere"  # defaults to atmosphere
 
-    def test_create_bridge_no_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_create_bridge_no_keys(
+        self, server_module: ModuleType, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
         monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
-        from server import create_bridge
-        bridge = create_bridge()
+        bridge = server_module.create_bridge()
         # Without keys, should create LyriaBridge (which falls back to mock)
-        from lyria_bridge import LyriaBridge
         assert isinstance(bridge, LyriaBridge)
 
-    def test_get_backend_name_mock(self) -> None:
-        from server import get_backend_name
+    def test_get_backend_name_mock(self, server_module: ModuleType) -> None:
         # The module-level bridge is mock without API keys
-        name = get_backend_name()
+        name = server_module.get_backend_name()
         assert name in ("mock", "lyria", "elevenlabs")
+
+    def test_lens_catalog_built_once(self, server_module: ModuleType) -> None:
+        assert server_module.lens_catalog() is server_module.lens_catalog()
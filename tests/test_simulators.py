@@ -15,6 +15,35 @@ from data_sources.simulators import (
 )
 
 
+_WEATHER_KEYS = frozenset({
+    "temperature", "wind_speed", "humidity", "pressure", "rain_probability",
+})
+_CARDIAC_KEYS = frozenset({
+    "heart_rate", "rr_interval_ms", "hrv_sdnn_ms",
+    "ecg_value", "arrhythmia", "stress", "exercise_level",
+})
+_NETWORK_KEYS = frozenset({
+    "packet_rate", "packet_count", "latency_ms", "error_rate",
+    "errors", "is_burst", "throughput_mbps", "active_edges",
+    "nodes", "load_level",
+})
+
+_WEATHER_RANGES = [
+    ("temperature", -10, 40),        # C
+    ("wind_speed", 0, 100),          # km/h
+    ("humidity", 0, 100),            # %
+    ("pressure", 990, 1030),         # hPa
+    ("rain_probability", 0, 1),
+]
+
+# Shared 0.1 s tick grids
+_T50 = tuple(i * 0.1 for i in range(50))
+_T100 = tuple(i * 0.1 for i in range(100))
+
+# Edge and log-spaced t values (1 ms .. 10^4 s) that the fixed 0.1 s grids miss
+_WIDE_TS = (0.0, 5e-324, 1e-9) + tuple(10 ** (k / 20) for k in range(-60, 81))
+
+
 # ── WeatherSimulator ───────────────────────────────────────────────────
 
 
@@ -23,38 +52,29 @@ class TestWeatherSimulator:
 
     def test_tick_returns_expected_keys(self, weather_sim: WeatherSimulator) -> None:
         data = weather_sim.tick(0.0)
-        expected = {"temperature", "wind_speed", "humidity", "pressure", "rain_probability"}
-        assert set(data.keys()) == expected
-
-    def test_temperature_range(self, weather_sim: WeatherSimulator) -> None:
-        """Temperature must stay within -10 to 40 C."""
-        for t in range(500):
-            data = weather_sim.tick(t * 0.1)
-            assert -10 <= data["temperature"] <= 40
-
-    def test_wind_speed_range(self, weather_sim: WeatherSimulator) -> None:
-        """Wind speed must stay within 0 to 100 km/h."""
-        for t in range(500):
-            data = weather_sim.tick(t * 0.1)
-            assert 0 <= data["wind_speed"] <= 100
-
-    def test_humidity_range(self, weather_sim: WeatherSimulator) -> None:
-        """Humidity must stay within 0 to 100%."""
-        for t in range(500):
-            data = weather_sim.tick(t * 0.1)
-            assert 0 <= data["humidity"] <= 100
-
-    def test_pressure_range(self, weather_sim: WeatherSimulator) -> None:
-        """Pressure must stay within 990 to 1030 hPa."""
-        for t in range(500):
-            data = weather_sim.tick(t * 0.1)
-            assert 990 <= data["pressure"] <= 1030
-
-    def test_rain_probability_range(self, weather_sim: WeatherSimulator) -> None:
-        """Rain probability must stay within 0 to 1."""
-        for t in range(500):
-            data = weather_sim.tick(t * 0.1)
-            assert 0 <= data["rain_probability"] <= 1
+        assert data.keys() == _WEATHER_KEYS
+
+    @pytest.mark.parametrize("field,lo,hi", _WEATHER_RANGES)
+    def test_field_range(self, weather_columns: dict, field: str, lo: float, hi: float) -> None:
+        """Every field must stay within its documented range over a 50 s run."""
+        column = weather_columns[field]
+        assert lo <= min(column)
+        assert max(column) <= hi
+
+    def test_field_range_wide_t(self) -> None:
+        """Ranges must also hold for tiny and very large t."""
+        columns = WeatherSimulator(seed=7).tick_batch(_WIDE_TS)
+        for field, lo, hi in _WEATHER_RANGES:
+            assert lo <= min(columns[field]), field
+            assert max(columns[field]) <= hi, field
+
+    def test_tick_batch_matches_tick(self) -> None:
+        """tick_batch must return exactly what per-t tick() calls would."""
+        ts = [t * 0.5 for t in range(20)]
+        batch = WeatherSimulator(seed=42).tick_batch(ts)
+        sim = WeatherSimulator(seed=42)
+        rows = [sim.tick(t) for t in ts]
+        assert batch == {key: [row[key] for row in rows] for key in rows[0]}
 
     def test_deterministic_with_same_seed(self) -> None:
         """Same seed should produce same results."""
@@ -83,11 +103,7 @@ class TestCardiacSimulator:
 
     def test_tick_returns_expected_keys(self, cardiac_sim: CardiacSimulator) -> None:
         data = cardiac_sim.tick(0.0)
-        expected = {
-            "heart_rate", "rr_interval_ms", "hrv_sdnn_ms",
-            "ecg_value", "arrhythmia", "stress", "exercise_level",
-        }
-        assert set(data.keys()) == expected
+        assert data.keys() == _CARDIAC_KEYS
 
     def test_heart_rate_at_rest(self, cardiac_sim: CardiacSimulator) -> None:
         """Resting heart rate should be near 72 bpm."""
@@ -105,28 +121,31 @@ class TestCardiacSimulator:
         target_exercise = 72.0 + 100.0
         assert target_exercise > target_rest
 
-    def test_heart_rate_range(self, cardiac_sim: CardiacSimulator) -> None:
+    def test_heart_rate_range(self, cardiac_stress_sweep: list[dict]) -> None:
         """Heart rate should be clamped to 40-200."""
-        for t in range(100):
-            data = cardiac_sim.tick(t * 0.1, exercise_level=1.0, stress=1.0)
+        for data in cardiac_stress_sweep:
             assert data["heart_rate"] >= 30  # with HRV noise, allow slightly lower
             assert data["heart_rate"] <= 250  # with HRV noise, allow slightly higher
 
-    def test_hrv_sdnn_positive(self, cardiac_sim: CardiacSimulator) -> None:
+    def test_hrv_sdnn_positive(self, cardiac_sweep: list[dict]) -> None:
         """HRV SDNN should be non-negative."""
-        for t in range(50):
-            data = cardiac_sim.tick(t * 0.1)
+        for data in cardiac_sweep:
             assert data["hrv_sdnn_ms"] >= 0
 
-    def test_ecg_value_bounded(self, cardiac_sim: CardiacSimulator) -> None:
+    def test_ecg_value_bounded(self, cardiac_sweep: list[dict]) -> None:
         """ECG waveform values should be bounded."""
-        for t in range(200):
-            data = cardiac_sim.tick(t * 0.01)
+        for data in cardiac_sweep:
             assert -1.0 <= data["ecg_value"] <= 1.5
 
-    def test_arrhythmia_is_bool(self, cardiac_sim: CardiacSimulator) -> None:
-        data = cardiac_sim.tick(1.0)
-        assert isinstance(data["arrhythmia"], bool)
+    def test_ecg_value_bounded_wide_t(self, cardiac_sim: CardiacSimulator) -> None:
+        """ECG stays bounded for tiny and very large t."""
+        for t in _WIDE_TS:
+            data = cardiac_sim.tick(t)
+            assert -1.0 <= data["ecg_value"] <= 1.5, t
+            assert data["hrv_sdnn_ms"] >= 0
+
+    def test_arrhythmia_is_bool(self, cardiac_sweep: list[dict]) -> None:
+        assert all(isinstance(data["arrhythmia"], bool) for data in cardiac_sweep)
 
     def test_stress_passed_through(self, cardiac_sim: CardiacSimulator) -> None:
         data = cardiac_sim.tick(1.0, stress=0.75)
@@ -143,10 +162,10 @@ class TestCardiacSimulator:
 class TestLorenzAttractor:
     """Tests for the Lorenz system integrator."""
 
-    def test_initial_position(self, lorenz: LorenzAttractor) -> None:
-        assert lorenz.x == 1.0
-        assert lorenz.y == 1.0
-        assert lorenz.z == 1.0
+    def test_initial_position(self, lorenz_fresh: LorenzAttractor) -> None:
+        assert lorenz_fresh.x == 1.0
+        assert lorenz_fresh.y == 1.0
+        assert lorenz_fresh.z == 1.0
 
     def test_step_returns_tuple(self, lorenz: LorenzAttractor) -> None:
         result = lorenz.step()
@@ -159,17 +178,33 @@ class TestLorenzAttractor:
         # After one step, position should have changed
         assert not (lorenz.x == x0 and lorenz.y == y0 and lorenz.z == z0)
 
-    def test_trail_grows(self, lorenz: LorenzAttractor) -> None:
-        assert len(lorenz._trail) == 0
+    def test_trail_grows(self, lorenz_fresh: LorenzAttractor) -> None:
+        assert len(lorenz_fresh._trail) == 0
         for i in range(10):
-            lorenz.step()
-        assert len(lorenz._trail) == 10
+            lorenz_fresh.step()
+        assert len(lorenz_fresh._trail) == 10
+
+    def test_step_n_matches_step(self) -> None:
+        """step_n(n) must land on the same state and trail as n step() calls."""
+        a, b = LorenzAttractor(), LorenzAttractor()
+        for _ in range(300):
+            a.step()
+        assert b.step_n(300) == (a.x, a.y, a.z)
+        assert b._trail == a._trail
 
     def test_trail_max_length(self, lorenz: LorenzAttractor) -> None:
-        for _ in range(600):
-            lorenz.step()
+        lorenz.step_n(600)
         assert len(lorenz._trail) == lorenz._max_trail
 
+    def test_recent_returns_trail_tail(self, lorenz_fresh: LorenzAttractor) -> None:
+        """recent(n) is the last n trail points in order, capped at the trail length."""
+        for _ in range(600):
+            lorenz_fresh.step()
+        trail = list(lorenz_fresh._trail)
+        assert lorenz_fresh.recent(10) == trail[-10:]
+        assert lorenz_fresh.recent(1000) == trail
+        assert lorenz_fresh.recent(10)[-1] == (lorenz_fresh.x, lorenz_fresh.y, lorenz_fresh.z)
+
     def test_chaos_metric_range(self, lorenz: LorenzAttractor) -> None:
         """chaos_metric should always be in [0, 1]."""
         for _ in range(100):
@@ -177,11 +212,11 @@ class TestLorenzAttractor:
         metric = lorenz.chaos_metric
         assert 0.0 <= metric <= 1.0
 
-    def test_chaos_metric_default_with_few_points(self, lorenz: LorenzAttractor) -> None:
+    def test_chaos_metric_default_with_few_points(self, lorenz_fresh: LorenzAttractor) -> None:
         """With fewer than 10 trail points, chaos_metric returns 0.5."""
         for _ in range(5):
-            lorenz.step()
-        assert lorenz.chaos_metric == 0.5
+            lorenz_fresh.step()
+        assert lorenz_fresh.chaos_metric == 0.5
 
     def test_default_parameters(self, lorenz: LorenzAttractor) -> None:
         assert lorenz.sigma == 10.0
@@ -198,9 +233,8 @@ class TestLorenzAttractor:
 
     def test_attractor_does_not_diverge(self, lorenz: LorenzAttractor) -> None:
         """With standard parameters, trajectory should stay bounded."""
-        for _ in range(2000):
-            lorenz.step()
-        dist = math.sqrt(lorenz.x**2 + lorenz.y**2 + lorenz.z**2)
+        lorenz.step_n(2000)
+        dist = math.hypot(lorenz.x, lorenz.y, lorenz.z)
         assert dist < 200  # bounded for standard Lorenz
 
 
@@ -239,26 +273,21 @@ class TestMathSimulator:
         assert "n_waves" in data
         assert "components" in data
 
-    def test_lorenz_amplitude_bounded(self, math_sim: MathSimulator) -> None:
-        for t in range(50):
-            data = math_sim.tick(t * 0.1, mode="lorenz")
-            assert 0 <= data["amplitude"] <= 1.0
-
-    def test_logistic_amplitude_bounded(self, math_sim: MathSimulator) -> None:
-        for t in range(50):
-            data = math_sim.tick(t * 0.1, mode="logistic", chaos_param=0.5)
-            assert 0 <= data["amplitude"] <= 1.0
-
-    def test_sine_amplitude_bounded(self, math_sim: MathSimulator) -> None:
-        for t in range(50):
-            data = math_sim.tick(t * 0.1, mode="sine")
+    @pytest.mark.parametrize("mode,kwargs", [
+        ("lorenz", {}),
+        ("logistic", {"chaos_param": 0.5}),
+        ("sine", {}),
+    ])
+    def test_amplitude_bounded(self, math_sim: MathSimulator, mode: str, kwargs: dict) -> None:
+        for t in _T50:
+            data = math_sim.tick(t, mode=mode, **kwargs)
             assert 0 <= data["amplitude"] <= 1.0
 
     def test_chaos_level_bounded(self, math_sim: MathSimulator) -> None:
         """chaos_level should always be in [0, 1]."""
         for mode in ["lorenz", "logistic", "sine"]:
-            for t in range(50):
-                data = math_sim.tick(t * 0.1, mode=mode, chaos_param=0.7)
+            for t in _T50:
+                data = math_sim.tick(t, mode=mode, chaos_param=0.7)
                 assert 0.0 <= data["chaos_level"] <= 1.0, f"Failed for mode={mode}, t={t}"
 
     def test_logistic_r_range(self, math_sim: MathSimulator) -> None:
@@ -266,18 +295,27 @@ class TestMathSimulator:
         data_low = math_sim.tick(0.0, mode="logistic", chaos_param=0.0)
         assert abs(data_low["r"] - 2.5) < 0.01
 
-        sim2 = MathSimulator()
-        data_high = sim2.tick(0.0, mode="logistic", chaos_param=1.0)
+        math_sim.reset()
+        data_high = math_sim.tick(0.0, mode="logistic", chaos_param=1.0)
         assert abs(data_high["r"] - 4.0) < 0.01
 
     def test_sine_n_waves_increases_with_chaos(self, math_sim: MathSimulator) -> None:
         """Higher chaos_param should produce more sine waves."""
         low = math_sim.tick(1.0, mode="sine", chaos_param=0.0)
         # Reset to avoid state from previous call
-        sim2 = MathSimulator()
-        high = sim2.tick(1.0, mode="sine", chaos_param=1.0)
+        math_sim.reset()
+        high = math_sim.tick(1.0, mode="sine", chaos_param=1.0)
         assert high["n_waves"] >= low["n_waves"]
 
+    def test_reset_matches_fresh_instance(self, math_sim: MathSimulator) -> None:
+        """After reset(), every mode replays like a new MathSimulator."""
+        for mode in ("lorenz", "logistic", "sine"):
+            math_sim.tick(1.0, mode=mode)
+        math_sim.reset()
+        fresh = MathSimulator()
+        for mode in ("lorenz", "logistic", "sine"):
+            assert math_sim.tick(2.0, mode=mode) == fresh.tick(2.0, mode=mode)
+
 
 # ── NetworkSimulator ────────────────────────────────────────────────────
 
@@ -287,34 +325,29 @@ class TestNetworkSimulator:
 
     def test_tick_returns_expected_keys(self, network_sim: NetworkSimulator) -> None:
         data = network_sim.tick(1.0)
-        expected = {
-            "packet_rate", "packet_count", "latency_ms", "error_rate",
-            "errors", "is_burst", "throughput_mbps", "active_edges",
-            "nodes", "load_level",
-        }
-        assert set(data.keys()) == expected
+        assert data.keys() == _NETWORK_KEYS
 
     def test_packet_count_non_negative(self, network_sim: NetworkSimulator) -> None:
         """Packet count must be non-negative."""
-        for t in range(100):
-            data = network_sim.tick(t * 0.1)
+        for t in _T100:
+            data = network_sim.tick(t)
             assert data["packet_count"] >= 0
 
     def test_latency_positive(self, network_sim: NetworkSimulator) -> None:
         """Latency must be positive."""
-        for t in range(100):
-            data = network_sim.tick(t * 0.1)
+        for t in _T100:
+            data = network_sim.tick(t)
             assert data["latency_ms"] >= 1
 
     def test_error_rate_non_negative(self, network_sim: NetworkSimulator) -> None:
-        for t in range(100):
-            data = network_sim.tick(t * 0.1)
+        for t in _T100:
+            data = network_sim.tick(t)
             assert data["error_rate"] >= 0
 
     def test_errors_do_not_exceed_packets(self, network_sim: NetworkSimulator) -> None:
         """Errors cannot exceed packet count."""
-        for t in range(100):
-            data = network_sim.tick(t * 0.1)
+        for t in _T100:
+            data = network_sim.tick(t)
             assert data["errors"] <= data["packet_count"]
 
     def test_load_level_range(self, network_sim: NetworkSimulator) -> None:
@@ -331,6 +364,10 @@ class TestNetworkSimulator:
         assert isinstance(data["nodes"], list)
         assert len(data["nodes"]) == 8  # default node count
 
+    def test_nodes_built_once(self, network_sim: NetworkSimulator) -> None:
+        """The node layout is built in __init__ and reused by every tick."""
+        assert network_sim.tick(1.0)["nodes"] is network_sim.tick(2.0)["nodes"]
+
     def test_active_edges_valid_structure(self, network_sim: NetworkSimulator) -> None:
         """Active edges should have src, dst, packets."""
         data = network_sim.tick(1.0, load_level=0.5)
@@ -345,8 +382,8 @@ class TestNetworkSimulator:
         assert isinstance(data["is_burst"], bool)
 
     def test_throughput_non_negative(self, network_sim: NetworkSimulator) -> None:
-        for t in range(50):
-            data = network_sim.tick(t * 0.1)
+        for t in _T50:
+            data = network_sim.tick(t)
             assert data["throughput_mbps"] >= 0
 
     def test_poisson_zero_rate(self, network_sim: NetworkSimulator) -> None:
@@ -356,18 +393,32 @@ class TestNetworkSimulator:
 
     def test_poisson_positive_rate(self, network_sim: NetworkSimulator) -> None:
         """Poisson should return non-negative integers."""
-        for _ in range(100):
-            result = network_sim._poisson(5.0)
+        for result in network_sim._poisson_batch(5.0, 100):
             assert isinstance(result, int)
             assert result >= 0
 
+    def test_poisson_knuth_fixed_uniform(
+        self, network_sim: NetworkSimulator, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With every uniform draw at 0.5, Knuth stops once 0.5**k <= exp(-lam)."""
+        monkeypatch.setattr(network_sim._rng, "random", lambda: 0.5)
+        assert network_sim._poisson(5.0) == 7  # 0.5**8 is the first <= exp(-5)
+        assert network_sim._poisson(0.5) == 0  # 0.5**1 <= exp(-0.5)
+
     def test_poisson_large_lambda_gaussian_fallback(self, network_sim: NetworkSimulator) -> None:
         """Large lambda uses Gaussian approximation."""
-        results = [network_sim._poisson(1000) for _ in range(50)]
+        results = network_sim._poisson_batch(1000, 50)
         mean_result = sum(results) / len(results)
         # Should be roughly around 1000
         assert 800 < mean_result < 1200
 
+    @pytest.mark.parametrize("lam", [0, 5.0, 1000])
+    def test_poisson_batch_matches_poisson(self, lam: float) -> None:
+        """_poisson_batch must consume the RNG exactly like repeated _poisson calls."""
+        a, b = NetworkSimulator(), NetworkSimulator()
+        assert b._poisson_batch(lam, 30) == [a._poisson(lam) for _ in range(30)]
+        assert b._rng.getstate() == a._rng.getstate()
+
     def test_packet_rate_increases_with_load(self, network_sim: NetworkSimulator) -> None:
         """Higher load should produce higher packet rate."""
         data_low = network_sim.tick(1.0, load_level=0.0)